@@ -8,6 +8,11 @@ from server.handler_methods import handle_message_post, serve_messages
 from server.storage import init_storage
 from server.logger import setup_logging
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logger = setup_logging()
 
 async def init_app() -> web.Application:
@@ -27,11 +32,26 @@ async def init_app() -> web.Application:
     # Setup routes
     app.router.add_post('/messages', handle_message_post)
     app.router.add_get('/messages', serve_messages)
-    
+
+    # Flush pending GitHub syncs when the server shuts down
+    app.on_cleanup.append(close_storage)
+
     return app
 
+
+async def close_storage(app: web.Application):
+    """Close the storage backend if it supports it."""
+    close = getattr(app['storage'], 'close', None)
+    if close is not None:
+        await close()
+
 def main():
     """Run the server."""
+    # uvloop's libuv-based event loop cuts per-await overhead on the
+    # I/O-heavy message paths; fall back to the default loop without it
+    if uvloop is not None:
+        uvloop.install()
+        logger.debug("uvloop installed as the event loop policy")
     app = asyncio.run(init_app())
     web.run_app(app)
 
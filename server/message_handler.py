@@ -10,6 +10,7 @@ from pathlib import Path
 from aiohttp import web
 
 from server.config import STORAGE_DIR
+from server.storage.file_storage import Message
 
 logger = logging.getLogger(__name__)
 
@@ -80,7 +81,12 @@ class MessageHandler:
             messages = await self.get_messages()
             return {
                 'success': True,
-                'messages': messages
+                # Storage backends may return Message records; convert them
+                # to plain dicts only here, at the serialization boundary
+                'messages': [
+                    message.to_dict() if isinstance(message, Message) else message
+                    for message in messages
+                ]
             }
         except Exception as e:
             return {
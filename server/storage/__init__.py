@@ -6,6 +6,8 @@ from datetime import datetime
 import os
 import logging
 
+from server.storage.file_storage import Message
+
 class StorageBackend(ABC):
     """Abstract base class for storage backends."""
     
@@ -27,12 +29,12 @@ class StorageBackend(ABC):
         pass
     
     @abstractmethod
-    async def get_messages(self) -> List[Dict[str, Any]]:
-        """Retrieve messages."""
+    async def get_messages(self) -> List[Message]:
+        """Retrieve messages as Message records."""
         pass
-    
+
     @abstractmethod
-    async def get_message_by_id(self, message_id: str) -> Optional[Dict[str, Any]]:
+    async def get_message_by_id(self, message_id: str) -> Optional[Message]:
         """Retrieve a specific message by ID."""
         pass
 
@@ -1,16 +1,190 @@
 """File-based storage implementation."""
 
+import asyncio
 import json
+import mmap
 import os
 import logging
-import re
+import threading
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional
 from server.storage.git_manager import GitManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import aiofiles
+    import aiofiles.os
+except ImportError:
+    aiofiles = None
+
 logger = logging.getLogger(__name__)
 
+# GitHub sync configuration is environment-derived and stable for the
+# process lifetime, so it is read once and cached. The read happens on
+# first FileStorage construction rather than at import: this module is
+# imported before server.config runs load_dotenv(), so an import-time
+# read would miss everything configured via .env.
+_SYNC_CONFIG = None
+
+
+def _sync_config() -> bool:
+    """Whether GitHub sync is configured, read from the environment once."""
+    global _SYNC_CONFIG
+    if _SYNC_CONFIG is None:
+        _SYNC_CONFIG = bool(
+            os.environ.get('SYNC_TO_GITHUB', 'false').lower() == 'true'
+            and os.environ.get('GITHUB_TOKEN')
+            and os.environ.get('GITHUB_REPO')
+        )
+    return _SYNC_CONFIG
+
+
+def _dumps(obj: dict) -> bytes:
+    """Serialize a message dict to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes) -> dict:
+    """Deserialize JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _slice_message_id(ts: str) -> Optional[str]:
+    """Build a YYYYMMDD_HHMMSS ID from a canonical ISO timestamp by slicing.
+
+    Returns None unless the first 19 characters are a well-formed
+    YYYY-MM-DDTHH:MM:SS with every field in range, so malformed input
+    falls through to strptime instead of producing a garbage ID.
+    """
+    if len(ts) < 19 or ts[4] != '-' or ts[7] != '-' or ts[10] != 'T' \
+            or ts[13] != ':' or ts[16] != ':':
+        return None
+    year, month, day = ts[0:4], ts[5:7], ts[8:10]
+    hour, minute, second = ts[11:13], ts[14:16], ts[17:19]
+    for run in (year, month, day, hour, minute, second):
+        if not run.isdigit():
+            return None
+    if not (1 <= int(month) <= 12 and 1 <= int(day) <= 31
+            and int(hour) < 24 and int(minute) < 60 and int(second) < 60):
+        return None
+    return f"{year}{month}{day}_{hour}{minute}{second}"
+
+
+def _to_message(parsed: dict) -> 'Message':
+    """Build a Message from a parsed JSON record."""
+    return Message(
+        id=parsed.get('id'),
+        content=parsed.get('content'),
+        author=parsed.get('author'),
+        timestamp=parsed.get('timestamp')
+    )
+
+@dataclass(slots=True)
+class Message:
+    """A single chat message.
+
+    Slots give every record a fixed attribute layout instead of a per-record
+    dict, which keeps large scans compact in memory.
+    """
+    id: Optional[str] = None
+    content: Optional[str] = None
+    author: Optional[str] = None
+    timestamp: Optional[str] = None
+
+    def is_complete(self) -> bool:
+        """Whether all fields required by the API are present."""
+        return None not in (self.id, self.content, self.author)
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        """Plain-dict view for JSON serialization at the API boundary."""
+        return {
+            'id': self.id,
+            'content': self.content,
+            'author': self.author,
+            'timestamp': self.timestamp
+        }
+
+
+# Known header keys mapped to message fields. Parsing walks the content
+# line by line and dispatches each header with one dict lookup instead of
+# trying every known prefix in turn.
+_HEADER_FIELDS = {
+    'ID': 'id',
+    'Content': 'content',
+    'Author': 'author',
+    'Timestamp': 'timestamp'
+}
+
+
+def _parse_message_content(content: str) -> Message:
+    """Parse legacy message content looking for headers anywhere in the text.
+
+    Headers can be in any of these formats:
+    - ID: value
+    - Content: value
+    - Author: value
+    - Timestamp: value
+
+    Shared by every backend that reads the legacy per-file format, so all
+    of them hand back the same Message records.
+    """
+    message_data = {
+        'id': None,
+        'content': None,
+        'author': None,
+        'timestamp': None
+    }
+
+    # Single pass over the content: dispatch header lines to their
+    # fields, collect everything else as potential fallback content.
+    leftover = []
+    for line in content.splitlines():
+        colon = line.find(':')
+        field = _HEADER_FIELDS.get(line[:colon]) if colon > 0 else None
+        value = line[colon + 1:].strip() if field else None
+        if value:
+            # First occurrence of a header wins
+            if message_data[field] is None:
+                message_data[field] = value
+        else:
+            leftover.append(line)
+
+    # If no explicit content header found, use remaining text
+    if not message_data['content']:
+        clean_content = '\n'.join(leftover).strip()
+        if clean_content:
+            message_data['content'] = clean_content
+
+    return Message(**message_data)
+
+# Upper bound on cached parse results so a long-lived server cannot grow
+# the cache without limit; oldest entries are evicted first.
+_PARSE_CACHE_MAX = 100_000
+
+# How many saves a single GitHub sync may cover, and how long the sync
+# worker waits for more saves to batch before committing.
+_SYNC_BATCH_MAX = 50
+_SYNC_BATCH_WINDOW = 0.05
+
+# If a save grows the reusable write buffer past this, drop the buffer
+# afterwards so one huge message does not pin its memory forever.
+_SAVE_BUF_SHRINK = 128 * 1024
+
+# How much of a message file a by-ID lookup reads before deciding whether
+# it needs the rest; headers were always written first, so they almost
+# always fit in this peek.
+_HEAD_PEEK = 4096
+
 class FileStorage:
     """File-based storage implementation."""
 
@@ -19,94 +193,339 @@ class FileStorage:
         self.data_dir = Path(data_dir)
         self.messages_dir = self.data_dir / 'messages'
         self.messages_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.data_dir / 'messages.index'
+
+        # Append-only log that new messages are written to; the offset map
+        # (id -> byte offset into the log) is built lazily on first use
+        self.log_path = self.data_dir / 'messages.jsonl'
+        self._log_offsets: Optional[Dict[str, int]] = None
+        self._log_size = -1
+
+        # Log records cached as parallel arrays (structure-of-arrays):
+        # element i across the four lists is one message. Filled once by
+        # _load_log and appended to on save, so repeated get_messages calls
+        # serve the log from memory.
+        self._ids: List[str] = []
+        self._contents: List[str] = []
+        self._authors: List[str] = []
+        self._timestamps: List[Optional[str]] = []
+
+        # GitHub syncs are queued and batched by a background task, created
+        # lazily because __init__ runs outside the event loop
+        self._sync_queue: Optional[asyncio.Queue] = None
+        self._sync_task: Optional[asyncio.Task] = None
+        self._sync_loop = None
+
+        # Parsed messages keyed by path; entries are (mtime_ns, size, data)
+        # so unchanged files can be served without re-reading them
+        self._parse_cache: Dict[str, tuple] = {}
+
+        # Per-second ID counters and the set of legacy per-file IDs, so
+        # picking a unique ID never has to stat candidate paths
+        self._last_ts_counter: Dict[str, int] = {}
+        self._legacy_ids: Optional[set] = None
+
+        # Reusable write buffer; the lock covers fill + write because saves
+        # can run on different threads (one event loop per request thread)
+        self._save_buf = bytearray()
+        self._save_lock = threading.Lock()
         
-        # Initialize GitManager with proper configuration
-        github_token = os.environ.get('GITHUB_TOKEN')
-        github_repo = os.environ.get('GITHUB_REPO')
-        sync_to_github = os.environ.get('SYNC_TO_GITHUB', 'false').lower() == 'true'
-        
-        # Disable GitHub sync in test mode
+        # Decide whether GitHub sync is enabled; the GitManager itself is
+        # constructed lazily on first save to keep cold start cheap
+        self.git_manager = None
         if test_mode:
             logger.info("Test mode: GitHub sync disabled")
-            self.git_manager = None
-        elif sync_to_github and github_token and github_repo:
+            self._sync_enabled = False
+        elif _sync_config():
+            self._sync_enabled = True
+        else:
+            logger.warning("GitHub sync disabled or missing configuration")
+            self._sync_enabled = False
+
+    def _get_git_manager(self) -> Optional[GitManager]:
+        """Construct the GitManager on first use."""
+        if not self._sync_enabled:
+            return None
+        if self.git_manager is None:
             try:
                 self.git_manager = GitManager(self.data_dir)
                 logger.info("GitManager initialized successfully")
             except Exception as e:
                 logger.error(f"Failed to initialize GitManager: {e}")
-                self.git_manager = None
+                self._sync_enabled = False
+        return self.git_manager
+
+    def _parse_message_content(self, content: str) -> Message:
+        """Parse message content looking for headers anywhere in the text."""
+        return _parse_message_content(content)
+
+    def _cache_store(self, key: str, mtime_ns: int, size: int, data: Optional[Message]):
+        """Remember a parse result, evicting the oldest entry when full."""
+        if len(self._parse_cache) >= _PARSE_CACHE_MAX:
+            self._parse_cache.pop(next(iter(self._parse_cache)))
+        self._parse_cache[key] = (mtime_ns, size, data)
+
+    def _load_log(self):
+        """Read the append-only log into the in-memory column arrays.
+
+        One sequential pass fills the four parallel field lists and the
+        id -> byte offset map used by get_message_by_id and the uniqueness
+        check in save_message. The log is memory-mapped so each line is
+        parsed from a slice of the mapping rather than a heap copy of the
+        whole file.
+        """
+        offsets: Dict[str, int] = {}
+        ids, contents, authors, timestamps = [], [], [], []
+        size = 0
+        try:
+            with open(self.log_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        position = 0
+                        while True:
+                            line = mm.readline()
+                            if not line:
+                                break
+                            try:
+                                parsed = _loads(line)
+                                message_id = parsed.get('id')
+                                content = parsed.get('content')
+                                author = parsed.get('author')
+                                if None not in (message_id, content, author):
+                                    offsets[message_id] = position
+                                    ids.append(message_id)
+                                    contents.append(content)
+                                    authors.append(author)
+                                    timestamps.append(parsed.get('timestamp'))
+                            except ValueError as e:
+                                logger.error(f"Skipping malformed log line at offset {position}: {e}")
+                            position += len(line)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error reading message log: {e}")
+        self._log_offsets = offsets
+        self._log_size = size
+        self._ids, self._contents, self._authors, self._timestamps = ids, contents, authors, timestamps
+
+    def _refresh_log(self):
+        """(Re)load the log if it was never read or grew behind our back."""
+        try:
+            size = os.stat(self.log_path).st_size
+        except FileNotFoundError:
+            size = 0
+        if self._log_offsets is None or size != self._log_size:
+            self._load_log()
+
+    def _log_messages(self) -> List[Message]:
+        """Materialize Message records from the column arrays."""
+        return [
+            Message(id=i, content=c, author=a, timestamp=t)
+            for i, c, a, t in zip(self._ids, self._contents, self._authors, self._timestamps)
+        ]
+
+    def _read_log_record(self, offset: int) -> Optional[Message]:
+        """Read a single message from the log at a known byte offset."""
+        try:
+            with open(self.log_path, 'rb') as f:
+                f.seek(offset)
+                parsed = _loads(f.readline())
+            return _to_message(parsed)
+        except Exception as e:
+            logger.error(f"Error reading log record at offset {offset}: {e}")
+            return None
+
+    def _rebuild_index(self) -> List[Path]:
+        """Rebuild the message index from a directory scan.
+
+        Sorting the short ID strings is cheaper than sorting Path objects,
+        and their lexicographic order matches chronological order.
+        """
+        # scandir's DirEntry carries file-type info from the directory read
+        # itself, so is_file() needs no extra stat call per entry
+        with os.scandir(self.messages_dir) as entries:
+            names = sorted(
+                entry.name for entry in entries
+                if entry.name.endswith(('.txt', '.json')) and entry.is_file(follow_symlinks=False)
+            )
+        try:
+            with open(self.index_path, 'w', encoding='utf-8') as f:
+                f.writelines(name + '\n' for name in names)
+        except OSError as e:
+            logger.error(f"Error writing message index: {e}")
+        return [self.messages_dir / name for name in names]
+
+    def _list_message_files(self) -> List[Path]:
+        """Resolve message file paths from the append-only index.
+
+        The index turns repeated directory scans into one sequential read;
+        it is rebuilt from a scan when it does not exist yet (first run) or
+        when the directory changed behind our back (git pull, fork sync),
+        which one stat per call detects via the directory mtime.
+        """
+        try:
+            index_mtime = os.stat(self.index_path).st_mtime_ns
+            # >= rather than >: a change landing in the same clock tick as
+            # the last rebuild must not leave the index stale forever
+            if os.stat(self.messages_dir).st_mtime_ns >= index_mtime:
+                return self._rebuild_index()
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                names = f.read().splitlines()
+            # Older indexes stored bare IDs; those always referred to .txt files
+            return [
+                self.messages_dir / (name if name.endswith(('.txt', '.json')) else f"{name}.txt")
+                for name in names if name
+            ]
+        except FileNotFoundError:
+            return self._rebuild_index()
+
+    def _parse_raw(self, file_path: Path, raw: bytes) -> Optional[Message]:
+        """Parse the raw bytes of a message file, or None if incomplete."""
+        if file_path.suffix == '.json':
+            message_data = _to_message(_loads(raw))
         else:
-            logger.warning("GitHub sync disabled or missing configuration")
-            self.git_manager = None
+            # Legacy "Key: value" header format
+            message_data = self._parse_message_content(raw.decode('utf-8'))
+        # Only include messages that have required fields
+        if not message_data.is_complete():
+            return None
+        return message_data
 
-    def _parse_message_content(self, content: str) -> Dict[str, str]:
-        """Parse message content looking for headers anywhere in the text.
-        
-        Headers can be in any of these formats:
-        - ID: value
-        - Content: value
-        - Author: value
-        - Timestamp: value
+    def _read_one(self, file_path: Path) -> Optional[Message]:
+        """Read and parse a single message file, or None if unreadable/incomplete.
+
+        A stat call is used to serve unchanged files straight from the parse
+        cache, skipping the open/read/parse work entirely.
         """
-        message_data = {
-            'id': None,
-            'content': None,
-            'author': None,
-            'timestamp': None
-        }
-        
-        # Define header patterns
-        patterns = {
-            'id': r'(?:^|\n)ID:\s*(.+?)(?:\n|$)',
-            'content': r'(?:^|\n)Content:\s*(.+?)(?:\n|$)',
-            'author': r'(?:^|\n)Author:\s*(.+?)(?:\n|$)',
-            'timestamp': r'(?:^|\n)Timestamp:\s*(.+?)(?:\n|$)'
-        }
-        
-        # Extract values using patterns
-        for field, pattern in patterns.items():
-            match = re.search(pattern, content, re.MULTILINE)
-            if match:
-                message_data[field] = match.group(1).strip()
-        
-        # If no explicit content header found, use remaining text
-        if not message_data['content']:
-            # Remove all known headers
-            clean_content = content
-            for pattern in patterns.values():
-                clean_content = re.sub(pattern, '', clean_content, flags=re.MULTILINE)
-            # Use remaining text as content, after cleaning
-            clean_content = clean_content.strip()
-            if clean_content:
-                message_data['content'] = clean_content
+        try:
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
+                # Indexed file was removed; just skip it
+                return None
+            cached = self._parse_cache.get(str(file_path))
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
+
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            message_data = self._parse_raw(file_path, raw)
+            self._cache_store(str(file_path), st.st_mtime_ns, st.st_size, message_data)
+            return message_data
+        except Exception as e:
+            logger.error(f"Error reading message file {file_path}: {e}")
+        return None
 
+    def _parse_head(self, file_path: Path, raw: bytes) -> Optional[Message]:
+        """Parse a truncated head peek, or None if it cannot be trusted.
+
+        A JSON record larger than the peek has to be read in full, and a
+        legacy record is only trusted when every field, including an
+        explicit content header, landed inside the peek; fallback body
+        content could otherwise be silently truncated.
+        """
+        if file_path.suffix == '.json':
+            return None
+        # Drop the trailing partial line: a header cut at the peek boundary
+        # would otherwise parse as a truncated value and get cached
+        raw = raw[:raw.rfind(b'\n') + 1]
+        head = raw.decode('utf-8', errors='replace')
+        message_data = self._parse_message_content(head)
+        if message_data.timestamp is None or not message_data.is_complete():
+            return None
+        if not any(line.startswith('Content:') and line[8:].strip() for line in head.splitlines()):
+            return None
         return message_data
 
-    async def get_messages(self) -> List[Dict[str, Union[str, dict]]]:
-        """Get all messages from storage."""
-        messages = []
+    def _read_message_head(self, file_path: Path) -> Optional[Message]:
+        """Read a message file for a by-ID lookup, peeking at the head first.
+
+        The whole file is read only when the first few KiB do not already
+        yield a complete record, so lookups on huge-body files skip most of
+        the bytes.
+        """
         try:
-            # Use list to force immediate evaluation and avoid file handle issues
-            message_files = list(sorted(self.messages_dir.glob('*.txt')))
-            for file_path in message_files:
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        message_data = self._parse_message_content(content)
-                        # Only include messages that have required fields
-                        if all(message_data[field] is not None for field in ['id', 'content', 'author']):
-                            messages.append(message_data)
-                except Exception as e:
-                    logger.error(f"Error reading message file {file_path}: {e}")
-                    continue
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
+                return None
+            cached = self._parse_cache.get(str(file_path))
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
+
+            with open(file_path, 'rb') as f:
+                raw = f.read(_HEAD_PEEK)
+                if len(raw) == _HEAD_PEEK:
+                    message_data = self._parse_head(file_path, raw)
+                    if message_data is not None:
+                        self._cache_store(str(file_path), st.st_mtime_ns, st.st_size, message_data)
+                        return message_data
+                    raw += f.read()
+            message_data = self._parse_raw(file_path, raw)
+            self._cache_store(str(file_path), st.st_mtime_ns, st.st_size, message_data)
+            return message_data
+        except Exception as e:
+            logger.error(f"Error reading message file {file_path}: {e}")
+        return None
+
+    async def _read_one_async(self, file_path: Path) -> Optional[Message]:
+        """aiofiles variant of _read_one.
+
+        The event loop keeps scheduling other work while each read is in
+        flight, so reads of many files overlap at the kernel level.
+        """
+        try:
+            try:
+                st = await aiofiles.os.stat(file_path)
+            except FileNotFoundError:
+                return None
+            cached = self._parse_cache.get(str(file_path))
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
 
+            async with aiofiles.open(file_path, 'rb') as f:
+                raw = await f.read()
+            message_data = self._parse_raw(file_path, raw)
+            self._cache_store(str(file_path), st.st_mtime_ns, st.st_size, message_data)
+            return message_data
+        except Exception as e:
+            logger.error(f"Error reading message file {file_path}: {e}")
+        return None
+
+    async def get_messages(self) -> List[Message]:
+        """Get all messages from storage.
+
+        Messages come from the append-only log (one sequential read) plus
+        any legacy per-message files; legacy reads are dispatched to worker
+        threads and awaited together so the event loop stays responsive.
+        """
+        try:
+            message_files = self._list_message_files()
         except Exception as e:
             logger.error(f"Error listing message files: {e}")
+            message_files = []
+
+        # Cap in-flight reads to avoid exhausting file descriptors
+        semaphore = asyncio.Semaphore(32)
 
+        async def read_one(file_path):
+            async with semaphore:
+                if aiofiles is not None:
+                    return await self._read_one_async(file_path)
+                return await asyncio.to_thread(self._read_one, file_path)
+
+        # One stat call decides whether the cached log records are current
+        await asyncio.to_thread(self._refresh_log)
+
+        results = await asyncio.gather(*(read_one(p) for p in message_files))
+        messages = self._log_messages() + [message for message in results if message]
+        # IDs are YYYYMMDD_HHMMSS[_n], so sorting them once here preserves
+        # chronological order without sorting Path objects during the scan
+        messages.sort(key=lambda m: m.id)
         return messages
 
-    async def get_archived_messages(self) -> List[Dict[str, Union[str, dict]]]:
+    async def get_archived_messages(self) -> List[Message]:
         """Get all archived messages from storage."""
         # For now, return an empty list since archive functionality is not implemented
         return []
@@ -121,62 +540,190 @@ class FileStorage:
             Message ID if successful, None otherwise
         """
         try:
-            # Generate unique ID based on timestamp
-            timestamp = datetime.strptime(message['timestamp'], '%Y-%m-%dT%H:%M:%S%z')
-            message_id = timestamp.strftime('%Y%m%d_%H%M%S')
-            
-            # Ensure unique ID by appending counter if needed
-            counter = 0
+            # The offset map doubles as the ID-uniqueness check, so make
+            # sure it reflects the log before picking an ID
+            self._refresh_log()
+
+            # Generate unique ID based on timestamp. The canonical form is
+            # YYYY-MM-DDTHH:MM:SS with an offset, so plain slicing covers the
+            # hot path; strptime only runs for non-canonical inputs.
+            ts = message['timestamp']
+            message_id = _slice_message_id(ts)
+            if message_id is None:
+                timestamp = datetime.strptime(ts, '%Y-%m-%dT%H:%M:%S%z')
+                message_id = timestamp.strftime('%Y%m%d_%H%M%S')
+
+            # Ensure unique ID by appending a counter if needed. Legacy
+            # per-file IDs are loaded once from the index, so the check is
+            # pure dict/set lookups with no stat per candidate.
+            if self._legacy_ids is None:
+                self._legacy_ids = {path.stem for path in self._list_message_files()}
+
             base_id = message_id
-            while (self.messages_dir / f"{message_id}.txt").exists():
+            counter = self._last_ts_counter.get(base_id, -1) + 1
+            while True:
+                message_id = base_id if counter == 0 else f"{base_id}_{counter}"
+                if message_id not in self._log_offsets and message_id not in self._legacy_ids:
+                    break
                 counter += 1
-                message_id = f"{base_id}_{counter}"
-            
-            message_path = self.messages_dir / f"{message_id}.txt"
-            
-            # Format with headers at the top for readability
-            content = (
-                f"ID: {message_id}\n"
-                f"Content: {message['content']}\n"
-                f"Author: {message['author']}\n"
-                f"Timestamp: {message['timestamp']}\n"
+            self._last_ts_counter[base_id] = counter
+
+            message_data = Message(
+                id=message_id,
+                content=message['content'],
+                author=message['author'],
+                timestamp=message['timestamp']
             )
-            
-            with open(message_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            # Sync the new message to GitHub if GitManager is available
-            if self.git_manager:
+
+            # Append the whole record to the log in a single write() call,
+            # refilling the instance buffer instead of allocating a new one
+            with self._save_lock:
+                buf = self._save_buf
+                buf.clear()
+                buf += _dumps(message_data.to_dict())
+                buf += b'\n'
+                written = len(buf)
+                fd = os.open(self.log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
                 try:
-                    commit_message = f'Add message {message_id} from {message["author"]}'
-                    self.git_manager.sync_changes_to_github(message_path, message['author'], commit_message)
-                    logger.info(f"Successfully synced message {message_id} to GitHub")
-                except Exception as sync_error:
-                    logger.error(f"Failed to sync message to GitHub: {sync_error}")
-                    # Don't fail the save operation if sync fails
+                    offset = os.fstat(fd).st_size
+                    os.write(fd, buf)
+                finally:
+                    os.close(fd)
+                if written > _SAVE_BUF_SHRINK:
+                    self._save_buf = bytearray()
+            self._log_offsets[message_id] = offset
+            self._log_size = offset + written
+
+            # Keep the column arrays in step with the log
+            self._ids.append(message_id)
+            self._contents.append(message['content'])
+            self._authors.append(message['author'])
+            self._timestamps.append(message['timestamp'])
+
+            # Queue the new message for GitHub sync if GitManager is available
+            if self._get_git_manager():
+                self._enqueue_sync(message_id, message['author'])
             else:
                 logger.debug("Skipping GitHub sync - GitManager not available")
-            
+
             return message_id
 
         except Exception as e:
             logger.error(f"Error saving message: {e}")
             return None
 
-    async def get_message_by_id(self, message_id: str) -> Optional[Dict[str, Union[str, dict]]]:
+    def _enqueue_sync(self, message_id: str, author: str):
+        """Queue a saved message for the background GitHub sync worker.
+
+        The worker batches queued saves into one commit + push instead of
+        forking a git process per message. It is (re)created here because
+        the queue must belong to the currently running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._sync_task is None or self._sync_task.done() or self._sync_loop is not loop:
+            self._sync_queue = asyncio.Queue()
+            self._sync_task = loop.create_task(self._sync_worker())
+            self._sync_loop = loop
+        self._sync_queue.put_nowait((message_id, author))
+
+    async def _sync_worker(self):
+        """Drain the sync queue, batching many saves into one GitHub sync."""
+        items = []
+        inflight = None
+        try:
+            while True:
+                items.append(await self._sync_queue.get())
+                # Give closely spaced saves a moment to join this batch
+                await asyncio.sleep(_SYNC_BATCH_WINDOW)
+                while len(items) < _SYNC_BATCH_MAX:
+                    try:
+                        items.append(self._sync_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                # Hand the batch off before awaiting: cancellation lands in
+                # the await, and a batch already dispatched must not be
+                # flushed a second time by the handler below
+                batch, items = items, []
+                inflight = asyncio.ensure_future(asyncio.to_thread(self._sync_batch, batch))
+                # Shielded so cancelling the worker never cancels (or
+                # orphans) a sync already running in its thread
+                await asyncio.shield(inflight)
+                inflight = None
+        except asyncio.CancelledError:
+            # Wait out any batch still running in its thread so two git
+            # operations never touch the repo at once, then flush what was
+            # never dispatched
+            if inflight is not None and not inflight.done():
+                await asyncio.shield(inflight)
+            items.extend(self._drain_sync_queue())
+            if items:
+                self._sync_batch(items)
+            raise
+
+    def _drain_sync_queue(self) -> list:
+        """Pop everything currently waiting in the sync queue."""
+        items = []
+        while True:
+            try:
+                items.append(self._sync_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return items
+
+    async def close(self):
+        """Shut down the background sync worker.
+
+        Cancelling the worker triggers its flush branch, so saves still
+        waiting in the batching window are synced before the loop goes away.
+        """
+        if self._sync_task is not None and not self._sync_task.done():
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+        self._sync_task = None
+
+        # A worker cancelled before it ever ran skips its flush branch, so
+        # sync anything left in the queue here
+        if self._sync_queue is not None:
+            items = self._drain_sync_queue()
+            if items:
+                self._sync_batch(items)
+
+    def _sync_batch(self, items):
+        """Sync a batch of saved messages to GitHub in one commit."""
+        message_ids = [message_id for message_id, _ in items]
+        author = items[0][1]
+        if len(items) == 1:
+            commit_message = f'Add message {message_ids[0]} from {author}'
+        else:
+            commit_message = f'Add {len(items)} messages'
+        try:
+            self.git_manager.sync_changes_to_github(self.log_path, author, commit_message)
+            logger.info(f"Successfully synced {len(items)} message(s) to GitHub")
+        except Exception as sync_error:
+            logger.error(f"Failed to sync messages to GitHub: {sync_error}")
+            # Don't fail the save operation if sync fails
+
+    async def get_message_by_id(self, message_id: str) -> Optional[Message]:
         """Get a message by its ID."""
         try:
-            message_path = self.messages_dir / f"{message_id}.txt"
+            await asyncio.to_thread(self._refresh_log)
+
+            # Known offset in the log means one seek + one line read
+            offset = self._log_offsets.get(message_id)
+            if offset is not None:
+                return await asyncio.to_thread(self._read_log_record, offset)
+
+            # Fall back to the legacy per-message files
+            message_path = self.messages_dir / f"{message_id}.json"
             if not message_path.exists():
-                return None
+                message_path = self.messages_dir / f"{message_id}.txt"
+                if not message_path.exists():
+                    return None
 
-            with open(message_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                message_data = self._parse_message_content(content)
-                # Only return message if it has required fields
-                if all(message_data[field] is not None for field in ['id', 'content', 'author']):
-                    return message_data
-                return None
+            return await asyncio.to_thread(self._read_message_head, message_path)
 
         except Exception as e:
             logger.error(f"Error getting message: {e}")
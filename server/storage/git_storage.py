@@ -9,6 +9,7 @@ from pathlib import Path
 import subprocess
 
 from server.storage import StorageBackend
+from server.storage.file_storage import Message, _parse_message_content
 from server.storage.git_manager import GitManager
 from server.storage.user_branch_manager import UserBranchManager
 
@@ -95,7 +96,7 @@ class GitStorage(StorageBackend):
             logger.error(f"Error saving message: {e}")
             return None
 
-    async def get_messages(self) -> List[Dict[str, Any]]:
+    async def get_messages(self) -> List[Message]:
         """Retrieve messages from the Git repository."""
         try:
             messages = []
@@ -104,8 +105,8 @@ class GitStorage(StorageBackend):
                 try:
                     with open(file_path, 'r', encoding='utf-8') as f:
                         content = f.read()
-                        message_data = self._parse_message_content(content)
-                        if message_data:
+                        message_data = _parse_message_content(content)
+                        if message_data.is_complete():
                             messages.append(message_data)
                 except Exception as e:
                     logger.error(f"Error reading message file {file_path}: {e}")
@@ -115,7 +116,7 @@ class GitStorage(StorageBackend):
             logger.error(f"Error listing messages: {e}")
             return []
 
-    async def get_message_by_id(self, message_id: str) -> Optional[Dict[str, Any]]:
+    async def get_message_by_id(self, message_id: str) -> Optional[Message]:
         """Get a specific message by ID."""
         try:
             message_path = self.messages_dir / f"{message_id}.txt"
@@ -124,7 +125,7 @@ class GitStorage(StorageBackend):
 
             with open(message_path, 'r', encoding='utf-8') as f:
                 content = f.read()
-                return self._parse_message_content(content)
+                return _parse_message_content(content)
 
         except Exception as e:
             logger.error(f"Error getting message: {e}")
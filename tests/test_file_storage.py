@@ -1,8 +1,11 @@
 """Tests for file storage implementation."""
 
+import asyncio
 import os
+import time
 import pytest
 from pathlib import Path
+from unittest.mock import MagicMock
 from server.storage.file_storage import FileStorage
 
 @pytest.fixture
@@ -19,10 +22,10 @@ Author: test_user
 Timestamp: 2025-01-17T14:54:28-05:00"""
 
     message = temp_storage._parse_message_content(content)
-    assert message['id'] == '123'
-    assert message['content'] == 'Hello World'
-    assert message['author'] == 'test_user'
-    assert message['timestamp'] == '2025-01-17T14:54:28-05:00'
+    assert message.id == '123'
+    assert message.content == 'Hello World'
+    assert message.author == 'test_user'
+    assert message.timestamp == '2025-01-17T14:54:28-05:00'
 
 @pytest.mark.asyncio
 async def test_parse_message_headers_anywhere(temp_storage):
@@ -39,10 +42,10 @@ Timestamp: 2025-01-17T14:54:28-05:00
 Final text"""
 
     message = temp_storage._parse_message_content(content)
-    assert message['id'] == '123'
-    assert message['content'] == 'Hello World'
-    assert message['author'] == 'test_user'
-    assert message['timestamp'] == '2025-01-17T14:54:28-05:00'
+    assert message.id == '123'
+    assert message.content == 'Hello World'
+    assert message.author == 'test_user'
+    assert message.timestamp == '2025-01-17T14:54:28-05:00'
 
 @pytest.mark.asyncio
 async def test_parse_message_no_content_header(temp_storage):
@@ -56,10 +59,10 @@ that spans multiple lines
 and should be captured as content"""
 
     message = temp_storage._parse_message_content(content)
-    assert message['id'] == '123'
-    assert message['content'] == 'This is the actual message content\nthat spans multiple lines\nand should be captured as content'
-    assert message['author'] == 'test_user'
-    assert message['timestamp'] == '2025-01-17T14:54:28-05:00'
+    assert message.id == '123'
+    assert message.content == 'This is the actual message content\nthat spans multiple lines\nand should be captured as content'
+    assert message.author == 'test_user'
+    assert message.timestamp == '2025-01-17T14:54:28-05:00'
 
 @pytest.mark.asyncio
 async def test_save_and_retrieve_message(temp_storage):
@@ -77,9 +80,9 @@ async def test_save_and_retrieve_message(temp_storage):
     # Retrieve message
     retrieved = await temp_storage.get_message_by_id(message_id)
     assert retrieved is not None
-    assert retrieved['content'] == message['content']
-    assert retrieved['author'] == message['author']
-    assert retrieved['timestamp'] == message['timestamp']
+    assert retrieved.content == message['content']
+    assert retrieved.author == message['author']
+    assert retrieved.timestamp == message['timestamp']
 
 @pytest.mark.asyncio
 async def test_get_all_messages(temp_storage):
@@ -107,6 +110,161 @@ async def test_get_all_messages(temp_storage):
     
     # Verify message contents
     for original, stored in zip(messages, retrieved):
-        assert stored['content'] == original['content']
-        assert stored['author'] == original['author']
-        assert stored['timestamp'] == original['timestamp']
+        assert stored.content == original['content']
+        assert stored.author == original['author']
+        assert stored.timestamp == original['timestamp']
+
+@pytest.mark.asyncio
+async def test_close_does_not_resync_inflight_batch(temp_storage):
+    """Test that closing mid-sync waits it out instead of syncing twice."""
+    temp_storage._sync_enabled = True
+    temp_storage.git_manager = MagicMock()
+    temp_storage.git_manager.sync_changes_to_github.side_effect = (
+        lambda *args: time.sleep(0.3)
+    )
+
+    message_id = await temp_storage.save_message({
+        'content': 'Slow sync',
+        'author': 'test_user',
+        'timestamp': '2025-01-17T14:54:28-05:00'
+    })
+    assert message_id is not None
+
+    # Let the worker dispatch the batch, then shut down while the sync
+    # thread is still inside sync_changes_to_github
+    await asyncio.sleep(0.15)
+    await temp_storage.close()
+
+    temp_storage.git_manager.sync_changes_to_github.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_save_rejects_malformed_timestamp(temp_storage):
+    """Test that a garbage timestamp fails the save instead of minting an ID."""
+    message_id = await temp_storage.save_message({
+        'content': 'Bad clock',
+        'author': 'test_user',
+        'timestamp': '9999-99-99T99:99:99-05:00'
+    })
+    assert message_id is None
+    assert await temp_storage.get_messages() == []
+
+@pytest.mark.asyncio
+async def test_sync_worker_batches_saves(temp_storage):
+    """Test that queued saves are flushed as one GitHub sync batch."""
+    temp_storage._sync_enabled = True
+    temp_storage.git_manager = MagicMock()
+
+    for second in ('28', '29'):
+        message_id = await temp_storage.save_message({
+            'content': f'Message at second {second}',
+            'author': 'test_user',
+            'timestamp': f'2025-01-17T14:54:{second}-05:00'
+        })
+        assert message_id is not None
+
+    # Shutting down flushes everything still inside the batching window
+    await temp_storage.close()
+
+    sync = temp_storage.git_manager.sync_changes_to_github
+    sync.assert_called_once()
+    assert sync.call_args[0][0] == temp_storage.log_path
+    assert sync.call_args[0][2] == 'Add 2 messages'
+
+@pytest.mark.asyncio
+async def test_sync_worker_syncs_without_shutdown(temp_storage):
+    """Test that the background worker syncs a batch on its own."""
+    temp_storage._sync_enabled = True
+    temp_storage.git_manager = MagicMock()
+
+    message_id = await temp_storage.save_message({
+        'content': 'Background sync',
+        'author': 'test_user',
+        'timestamp': '2025-01-17T14:54:28-05:00'
+    })
+    assert message_id is not None
+
+    # Wait out the batching window so the worker commits the batch
+    await asyncio.sleep(0.2)
+
+    sync = temp_storage.git_manager.sync_changes_to_github
+    sync.assert_called_once()
+    assert sync.call_args[0][2] == f'Add message {message_id} from test_user'
+
+    await temp_storage.close()
+
+@pytest.mark.asyncio
+async def test_head_peek_serves_lookup_from_first_bytes(temp_storage):
+    """Test that a by-ID lookup trusts headers that fit in the head peek."""
+    message_id = '20250117_145428'
+    legacy = temp_storage.messages_dir / f'{message_id}.txt'
+    # Headers up front, then enough trailing text to overflow the peek
+    legacy.write_text(
+        f"ID: {message_id}\n"
+        "Content: Fits in the peek\n"
+        "Author: test_user\n"
+        "Timestamp: 2025-01-17T14:54:28-05:00\n"
+        + ('x' * 80 + '\n') * 100
+    )
+
+    message = await temp_storage.get_message_by_id(message_id)
+    assert message is not None
+    assert message.content == 'Fits in the peek'
+    assert message.author == 'test_user'
+
+@pytest.mark.asyncio
+async def test_head_peek_falls_back_for_large_body(temp_storage):
+    """Test that a body past the peek window is returned untruncated."""
+    message_id = '20250117_145429'
+    body = '\n'.join(f'line {n}: ' + 'y' * 70 for n in range(100))
+    legacy = temp_storage.messages_dir / f'{message_id}.txt'
+    # No explicit Content header, so the body is fallback content and the
+    # peek alone must not be trusted
+    legacy.write_text(
+        f"ID: {message_id}\n"
+        "Author: test_user\n"
+        "Timestamp: 2025-01-17T14:54:29-05:00\n"
+        "\n"
+        f"{body}\n"
+    )
+
+    message = await temp_storage.get_message_by_id(message_id)
+    assert message is not None
+    assert message.content == body
+
+@pytest.mark.asyncio
+async def test_head_peek_ignores_header_cut_at_boundary(temp_storage):
+    """Test that a header straddling the peek boundary is not truncated."""
+    message_id = '20250117_145430'
+    timestamp = '2025-01-17T14:54:30-05:00'
+    content = 'z' * 4020
+    legacy = temp_storage.messages_dir / f'{message_id}.txt'
+    # The long content line pushes the timestamp across the 4 KiB peek
+    # boundary, so its line is only partially inside the peek
+    legacy.write_text(
+        f"ID: {message_id}\n"
+        f"Content: {content}\n"
+        "Author: test_user\n"
+        f"Timestamp: {timestamp}\n"
+    )
+
+    message = await temp_storage.get_message_by_id(message_id)
+    assert message is not None
+    assert message.timestamp == timestamp
+    assert message.content == content
+
+@pytest.mark.asyncio
+async def test_out_of_band_files_are_picked_up(temp_storage):
+    """Test that files copied into messages/ after a scan become visible."""
+    assert await temp_storage.get_messages() == []
+
+    # Simulate a fork sync or git pull dropping a legacy file in place
+    legacy = temp_storage.messages_dir / '20250117_145428.txt'
+    legacy.write_text(
+        "ID: 20250117_145428\n"
+        "Content: Synced from a fork\n"
+        "Author: test_user\n"
+        "Timestamp: 2025-01-17T14:54:28-05:00\n"
+    )
+
+    messages = await temp_storage.get_messages()
+    assert [m.content for m in messages] == ['Synced from a fork']
@@ -38,56 +38,47 @@ class TestMessageStorage(unittest.IsolatedAsyncioTestCase):
             remove_dir_recursive(test_dir)
     
     async def test_message_saved_to_filesystem(self):
-        """Test that new messages are saved as files."""
+        """Test that new messages are appended to the message log."""
         # Create a test message
         test_content = "Test message content"
         test_author = "test_user"
-        
+
         # Create the message
         message = await self.handler.create_message(
             content=test_content,
             author=test_author
         )
-        
+
         # Verify message was created with an ID
         self.assertIsNotNone(message['id'])
-        
-        # Check that the message file exists
-        message_path = Path(self.test_storage_dir) / 'messages' / f"{message['id']}.txt"
-        self.assertTrue(message_path.exists())
-        
-        # Verify file contents
-        with open(message_path, 'r', encoding='utf-8') as f:
+
+        # Check that the message log exists
+        log_path = Path(self.test_storage_dir) / 'messages.jsonl'
+        self.assertTrue(log_path.exists())
+
+        # Verify log contents
+        with open(log_path, 'r', encoding='utf-8') as f:
             content = f.read()
             self.assertIn(test_content, content)
             self.assertIn(test_author, content)
             self.assertIn(message['timestamp'], content)
 
     async def test_message_username_storage(self):
-        """Test that message username is correctly stored in the message file."""
+        """Test that message username is correctly stored in the message log."""
         # Test with different usernames to ensure proper storage
         test_usernames = ["regular_user", "User With Spaces", "user123", "特殊文字"]
-        
+
         for username in test_usernames:
             # Create a message with the test username
             message = await self.handler.create_message(
                 content="Test content",
                 author=username
             )
-            
-            # Get the message file path
-            message_path = Path(self.test_storage_dir) / 'messages' / f"{message['id']}.txt"
-            
-            # Verify the file exists
-            self.assertTrue(message_path.exists())
-            
-            # Read the file contents and verify the username is stored correctly
-            with open(message_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                self.assertIn(username, content)
-                
-            # Clean up the test file
-            message_path.unlink()
+
+            # Retrieve the message and verify the username round-trips
+            stored = await self.storage.get_message_by_id(message['id'])
+            self.assertIsNotNone(stored)
+            self.assertEqual(stored.author, username)
 
 if __name__ == '__main__':
     unittest.main()